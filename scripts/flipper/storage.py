@@ -71,16 +71,20 @@ class BufferedRead:
 
     def until(self, eol: str = "\n", cut_eol: bool = True):
         eol = eol.encode("ascii")
+        start = 0
         while True:
-            # search in buffer
-            i = self.buffer.find(eol)
+            # search in buffer, skipping the part already scanned
+            i = self.buffer.find(eol, start)
             if i >= 0:
                 if cut_eol:
                     read = self.buffer[:i]
                 else:
                     read = self.buffer[: i + len(eol)]
-                self.buffer = self.buffer[i + len(eol) :]
+                # trim in place instead of copying the remainder
+                del self.buffer[: i + len(eol)]
                 return read
+            # eol may straddle the boundary with the next chunk
+            start = max(0, len(self.buffer) - len(eol) + 1)
 
             # read and append to buffer
             i = max(1, self.stream.in_waiting)
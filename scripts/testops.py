@@ -9,6 +9,19 @@ from flipper.app import App
 from flipper.storage import FlipperStorage
 from flipper.utils.cdc import resolve_port
 
+# Result lines have distinct prefixes, so a single anchored alternation
+# classifies a line in one pass; match.lastgroup names the metric
+METRICS_PATTERN = re.compile(
+    rb"(?P<tests>Failed tests: \d{0,})"
+    rb"|(?P<elapsed_time>Consumed: \d{0,})"
+    rb"|(?P<leak>Leaked: \d{0,})"
+    rb"|(?P<status>Status: \w{3,})"
+)
+METRICS_PREFIXES = (b"Failed tests: ", b"Consumed: ", b"Leaked: ", b"Status: ")
+
+DIGITS_PATTERN = re.compile(rb"\d+")
+SIGNED_DIGITS_PATTERN = re.compile(rb"[- ]\d+")
+
 
 class Main(App):
     # this is basic use without sub-commands, simply to reboot flipper / power it off, not meant as a full CLI wrapper
@@ -70,34 +83,29 @@ class Main(App):
         data = flipper.read.until(">: ")
         self.logger.info("Parsing result")
 
-        lines = data.decode().split("\r\n")
-
-        tests_re = r"Failed tests: \d{0,}"
-        time_re = r"Consumed: \d{0,}"
-        leak_re = r"Leaked: \d{0,}"
-        status_re = r"Status: \w{3,}"
+        lines = data.split(b"\r\n")
 
-        tests_pattern = re.compile(tests_re)
-        time_pattern = re.compile(time_re)
-        leak_pattern = re.compile(leak_re)
-        status_pattern = re.compile(status_re)
-
-        tests, elapsed_time, leak, status = None, None, None, None
+        metrics = {}
         total = 0
 
         for line in lines:
-            self.logger.info(line)
-            if "()" in line:
+            self.logger.info(line.decode(errors="replace"))
+            if b"()" in line:
                 total += 1
 
-            if not tests:
-                tests = re.match(tests_pattern, line)
-            if not elapsed_time:
-                elapsed_time = re.match(time_pattern, line)
-            if not leak:
-                leak = re.match(leak_pattern, line)
-            if not status:
-                status = re.match(status_pattern, line)
+            # Only the first occurrence of each result counts, so once all of
+            # them are collected the remaining lines are just logged
+            if len(metrics) == len(METRICS_PREFIXES):
+                continue
+            if not line.startswith(METRICS_PREFIXES):
+                continue
+            if match := METRICS_PATTERN.match(line):
+                metrics.setdefault(match.lastgroup, match)
+
+        tests = metrics.get("tests")
+        elapsed_time = metrics.get("elapsed_time")
+        leak = metrics.get("leak")
+        status = metrics.get("status")
 
         if None in (tests, elapsed_time, leak, status):
             self.logger.error(
@@ -105,10 +113,10 @@ class Main(App):
             )
             sys.exit(1)
 
-        leak = int(re.findall(r"[- ]\d+", leak.group(0))[0])
-        status = re.findall(r"\w+", status.group(0))[1]
-        tests = int(re.findall(r"\d+", tests.group(0))[0])
-        elapsed_time = int(re.findall(r"\d+", elapsed_time.group(0))[0])
+        leak = int(SIGNED_DIGITS_PATTERN.search(leak.group(0)).group(0))
+        status = status.group(0).split(b": ", 1)[1].decode()
+        tests = int(DIGITS_PATTERN.search(tests.group(0)).group(0))
+        elapsed_time = int(DIGITS_PATTERN.search(elapsed_time.group(0)).group(0))
 
         if tests > 0 or status != "PASSED":
             self.logger.error(f"Got {tests} failed tests.")